@@ -1,648 +1,164 @@
 """Utility script for generating a large roster of Roman characters for 248 BCE.
 
 The dataset aims to seed the game with historically inspired patrician and plebeian
-families. Executing this script will regenerate ``generated_characters.json`` which
-can be copied into ``base_characters.json``.
+families. The households are authored in ``families.tsv`` (one row per person) next
+to this script. Executing this script will regenerate ``generated_characters.json``
+which can be copied into ``base_characters.json``. Running it with ``--check``
+instead verifies that the process-pool formatting matches the serial path.
 """
 
+import csv
+import gc
 import json
+import multiprocessing
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, groupby, repeat
+from json.encoder import encode_basestring_ascii
+from operator import itemgetter
+from typing import NamedTuple, Optional, Tuple
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; without it only the JSON roster is written.
+    msgpack = None
+
+# Fastest available parser for re-reading the rendered roster.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    try:
+        from ujson import loads as _json_loads
+    except ImportError:
+        _json_loads = json.loads
 
 START_YEAR = -248
 
-families = [
-    {
-        "family": "Cornelius",
-        "branch": "Scipio",
-        "class": 0,
-        "husband": {"praenomen": "Publius", "cognomen": "Scipio Asina", "birth": -285, "traits": ["Naval", "Ambitious"], "wealth": 5600, "influence": 8},
-        "wife": {"nomen": "Cornelia", "cognomen": "Asina", "birth": -292, "traits": ["Pious", "Steadfast"], "wealth": 5400, "influence": 6},
-        "sons": [
-            {"praenomen": "Gnaeus", "cognomen": "Scipio", "birth": -268, "traits": ["Disciplined"], "wealth": 900, "influence": 3},
-            {"praenomen": "Lucius", "cognomen": "Scipio", "birth": -266, "traits": ["Studious"], "wealth": 860, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Scipio", "birth": -264, "traits": ["Graceful"], "wealth": 820, "influence": 2},
-            {"cognomen": "Scipio", "birth": -261, "traits": ["Curious"], "wealth": 790, "influence": 2}
-        ]
-    },
-    {
-        "family": "Aemilius",
-        "branch": "Paullus",
-        "class": 0,
-        "husband": {"praenomen": "Lucius", "cognomen": "Paullus", "birth": -284, "traits": ["Diplomatic", "Prudent"], "wealth": 5200, "influence": 7},
-        "wife": {"nomen": "Aemilia", "cognomen": "Paulla", "birth": -288, "traits": ["Cultured", "Pious"], "wealth": 5000, "influence": 6},
-        "sons": [
-            {"praenomen": "Marcus", "cognomen": "Paullus", "birth": -270, "traits": ["Analytical"], "wealth": 830, "influence": 3},
-            {"praenomen": "Quintus", "cognomen": "Paullus", "birth": -268, "traits": ["Bold"], "wealth": 810, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Paulla", "birth": -265, "traits": ["Loyal"], "wealth": 790, "influence": 2},
-            {"cognomen": "Paulla", "birth": -262, "traits": ["Studious"], "wealth": 760, "influence": 2}
-        ]
-    },
-    {
-        "family": "Fabius",
-        "branch": "Maximus",
-        "class": 0,
-        "husband": {"praenomen": "Quintus", "cognomen": "Maximus", "birth": -289, "traits": ["Strategic", "Patient"], "wealth": 5500, "influence": 8},
-        "wife": {"nomen": "Fabia", "cognomen": "Maxima", "birth": -293, "traits": ["Resolute"], "wealth": 5300, "influence": 6},
-        "sons": [
-            {"praenomen": "Marcus", "cognomen": "Maximus", "birth": -271, "traits": ["Observant"], "wealth": 880, "influence": 3},
-            {"praenomen": "Gaius", "cognomen": "Maximus", "birth": -269, "traits": ["Determined"], "wealth": 860, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Maxima", "birth": -266, "traits": ["Dutiful"], "wealth": 820, "influence": 2},
-            {"cognomen": "Maxima", "birth": -263, "traits": ["Cheerful"], "wealth": 780, "influence": 2}
-        ]
-    },
-    {
-        "family": "Claudius",
-        "branch": "Pulcher",
-        "class": 0,
-        "husband": {"praenomen": "Appius", "cognomen": "Pulcher", "birth": -287, "traits": ["Proud", "Charismatic"], "wealth": 5450, "influence": 8},
-        "wife": {"nomen": "Claudia", "cognomen": "Pulchra", "birth": -291, "traits": ["Elegant", "Shrewd"], "wealth": 5200, "influence": 6},
-        "sons": [
-            {"praenomen": "Publius", "cognomen": "Pulcher", "birth": -269, "traits": ["Bold"], "wealth": 850, "influence": 3},
-            {"praenomen": "Gaius", "cognomen": "Pulcher", "birth": -267, "traits": ["Eloquent"], "wealth": 830, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Pulchra", "birth": -264, "traits": ["Perceptive"], "wealth": 800, "influence": 2},
-            {"cognomen": "Pulchra", "birth": -261, "traits": ["Graceful"], "wealth": 780, "influence": 2}
-        ]
-    },
-    {
-        "family": "Valerius",
-        "branch": "Laevinus",
-        "class": 0,
-        "husband": {"praenomen": "Marcus", "cognomen": "Laevinus", "birth": -288, "traits": ["Naval", "Astute"], "wealth": 5300, "influence": 7},
-        "wife": {"nomen": "Valeria", "cognomen": "Laevina", "birth": -294, "traits": ["Pragmatic", "Virtuous"], "wealth": 5100, "influence": 5},
-        "sons": [
-            {"praenomen": "Publius", "cognomen": "Laevinus", "birth": -270, "traits": ["Adventurous"], "wealth": 820, "influence": 3},
-            {"praenomen": "Lucius", "cognomen": "Laevinus", "birth": -268, "traits": ["Diligent"], "wealth": 800, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Laevina", "birth": -265, "traits": ["Kind"], "wealth": 780, "influence": 2},
-            {"cognomen": "Laevina", "birth": -262, "traits": ["Attentive"], "wealth": 760, "influence": 2}
-        ]
-    },
-    {
-        "family": "Julius",
-        "branch": "Iulus",
-        "class": 0,
-        "husband": {"praenomen": "Gaius", "cognomen": "Iulus", "birth": -286, "traits": ["Charismatic", "Eloquent"], "wealth": 5400, "influence": 7},
-        "wife": {"nomen": "Julia", "cognomen": "Iula", "birth": -290, "traits": ["Hospitable", "Graceful"], "wealth": 5200, "influence": 6},
-        "sons": [
-            {"praenomen": "Sextus", "cognomen": "Iulus", "birth": -269, "traits": ["Charming"], "wealth": 840, "influence": 3},
-            {"praenomen": "Lucius", "cognomen": "Iulus", "birth": -267, "traits": ["Thoughtful"], "wealth": 820, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Iula", "birth": -264, "traits": ["Cheerful"], "wealth": 790, "influence": 2},
-            {"cognomen": "Iula", "birth": -261, "traits": ["Devout"], "wealth": 770, "influence": 2}
-        ]
-    },
-    {
-        "family": "Sempronius",
-        "branch": "Blesus",
-        "class": 1,
-        "husband": {"praenomen": "Tiberius", "cognomen": "Blesus", "birth": -283, "traits": ["Organized", "Patient"], "wealth": 4200, "influence": 6},
-        "wife": {"nomen": "Sempronia", "cognomen": "Blesa", "birth": -287, "traits": ["Clever", "Supportive"], "wealth": 4000, "influence": 4},
-        "sons": [
-            {"praenomen": "Publius", "cognomen": "Blesus", "birth": -268, "traits": ["Prudent"], "wealth": 700, "influence": 3},
-            {"praenomen": "Gaius", "cognomen": "Blesus", "birth": -265, "traits": ["Determined"], "wealth": 690, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Blesa", "birth": -263, "traits": ["Kind"], "wealth": 660, "influence": 2},
-            {"cognomen": "Blesa", "birth": -260, "traits": ["Observant"], "wealth": 640, "influence": 2}
-        ]
-    },
-    {
-        "family": "Fulvius",
-        "branch": "Flaccus",
-        "class": 1,
-        "husband": {"praenomen": "Quintus", "cognomen": "Flaccus", "birth": -284, "traits": ["Energetic", "Diplomatic"], "wealth": 4300, "influence": 6},
-        "wife": {"nomen": "Fulvia", "cognomen": "Flacca", "birth": -289, "traits": ["Resourceful", "Pious"], "wealth": 4100, "influence": 4},
-        "sons": [
-            {"praenomen": "Marcus", "cognomen": "Flaccus", "birth": -269, "traits": ["Ambitious"], "wealth": 710, "influence": 3},
-            {"praenomen": "Lucius", "cognomen": "Flaccus", "birth": -266, "traits": ["Steady"], "wealth": 690, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Flacca", "birth": -263, "traits": ["Gentle"], "wealth": 660, "influence": 2},
-            {"cognomen": "Flacca", "birth": -260, "traits": ["Inquisitive"], "wealth": 640, "influence": 2}
-        ]
-    },
-    {
-        "family": "Caecilius",
-        "branch": "Metellus",
-        "class": 0,
-        "husband": {"praenomen": "Lucius", "cognomen": "Metellus", "birth": -286, "traits": ["Meticulous", "Strategic"], "wealth": 5100, "influence": 7},
-        "wife": {"nomen": "Caecilia", "cognomen": "Metella", "birth": -291, "traits": ["Nurturing", "Wise"], "wealth": 5000, "influence": 5},
-        "sons": [
-            {"praenomen": "Quintus", "cognomen": "Metellus", "birth": -268, "traits": ["Orderly"], "wealth": 800, "influence": 3},
-            {"praenomen": "Gaius", "cognomen": "Metellus", "birth": -266, "traits": ["Ambitious"], "wealth": 780, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Metella", "birth": -263, "traits": ["Dutiful"], "wealth": 760, "influence": 2},
-            {"cognomen": "Metella", "birth": -260, "traits": ["Curious"], "wealth": 740, "influence": 2}
-        ]
-    },
-    {
-        "family": "Manlius",
-        "branch": "Vulso",
-        "class": 0,
-        "husband": {"praenomen": "Aulus", "cognomen": "Vulso", "birth": -287, "traits": ["Resolute", "Innovative"], "wealth": 5000, "influence": 7},
-        "wife": {"nomen": "Manlia", "cognomen": "Vulsa", "birth": -292, "traits": ["Patient", "Wise"], "wealth": 4800, "influence": 5},
-        "sons": [
-            {"praenomen": "Gnaeus", "cognomen": "Vulso", "birth": -269, "traits": ["Determined"], "wealth": 780, "influence": 3},
-            {"praenomen": "Lucius", "cognomen": "Vulso", "birth": -267, "traits": ["Analytical"], "wealth": 760, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Vulsa", "birth": -264, "traits": ["Calm"], "wealth": 740, "influence": 2},
-            {"cognomen": "Vulsa", "birth": -261, "traits": ["Lively"], "wealth": 720, "influence": 2}
-        ]
-    },
-    {
-        "family": "Sergius",
-        "branch": "Silus",
-        "class": 1,
-        "husband": {"praenomen": "Lucius", "cognomen": "Silus", "birth": -285, "traits": ["Brave", "Steadfast"], "wealth": 3800, "influence": 5},
-        "wife": {"nomen": "Sergia", "cognomen": "Sila", "birth": -289, "traits": ["Caring", "Pious"], "wealth": 3600, "influence": 4},
-        "sons": [
-            {"praenomen": "Gaius", "cognomen": "Silus", "birth": -268, "traits": ["Bold"], "wealth": 650, "influence": 3},
-            {"praenomen": "Marcus", "cognomen": "Silus", "birth": -265, "traits": ["Thoughtful"], "wealth": 630, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Sila", "birth": -262, "traits": ["Gentle"], "wealth": 610, "influence": 2},
-            {"cognomen": "Sila", "birth": -259, "traits": ["Perceptive"], "wealth": 600, "influence": 2}
-        ]
-    },
-    {
-        "family": "Sulpicius",
-        "branch": "Galba",
-        "class": 1,
-        "husband": {"praenomen": "Servius", "cognomen": "Galba", "birth": -284, "traits": ["Calculating", "Eloquent"], "wealth": 3900, "influence": 5},
-        "wife": {"nomen": "Sulpicia", "cognomen": "Galba", "birth": -288, "traits": ["Devout", "Insightful"], "wealth": 3700, "influence": 4},
-        "sons": [
-            {"praenomen": "Lucius", "cognomen": "Galba", "birth": -269, "traits": ["Persuasive"], "wealth": 660, "influence": 3},
-            {"praenomen": "Gaius", "cognomen": "Galba", "birth": -266, "traits": ["Strategic"], "wealth": 640, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Galba", "birth": -263, "traits": ["Observant"], "wealth": 620, "influence": 2},
-            {"cognomen": "Galba", "birth": -260, "traits": ["Helpful"], "wealth": 600, "influence": 2}
-        ]
-    },
-    {
-        "family": "Postumius",
-        "branch": "Albinus",
-        "class": 0,
-        "husband": {"praenomen": "Aulus", "cognomen": "Albinus", "birth": -286, "traits": ["Dutiful", "Firm"], "wealth": 5000, "influence": 6},
-        "wife": {"nomen": "Postumia", "cognomen": "Albina", "birth": -290, "traits": ["Generous", "Pious"], "wealth": 4800, "influence": 5},
-        "sons": [
-            {"praenomen": "Spurius", "cognomen": "Albinus", "birth": -269, "traits": ["Composed"], "wealth": 780, "influence": 3},
-            {"praenomen": "Aulus", "cognomen": "Albinus", "birth": -266, "traits": ["Determined"], "wealth": 760, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Albina", "birth": -263, "traits": ["Graceful"], "wealth": 740, "influence": 2},
-            {"cognomen": "Albina", "birth": -260, "traits": ["Curious"], "wealth": 720, "influence": 2}
-        ]
-    },
-    {
-        "family": "Papirius",
-        "branch": "Cursor",
-        "class": 0,
-        "husband": {"praenomen": "Lucius", "cognomen": "Cursor", "birth": -288, "traits": ["Disciplined", "Energetic"], "wealth": 5200, "influence": 7},
-        "wife": {"nomen": "Papiria", "cognomen": "Cursa", "birth": -292, "traits": ["Supportive", "Stoic"], "wealth": 5000, "influence": 5},
-        "sons": [
-            {"praenomen": "Gaius", "cognomen": "Cursor", "birth": -270, "traits": ["Energetic"], "wealth": 800, "influence": 3},
-            {"praenomen": "Marcus", "cognomen": "Cursor", "birth": -267, "traits": ["Disciplined"], "wealth": 780, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Cursa", "birth": -264, "traits": ["Pious"], "wealth": 760, "influence": 2},
-            {"cognomen": "Cursa", "birth": -261, "traits": ["Observant"], "wealth": 740, "influence": 2}
-        ]
-    },
-    {
-        "family": "Calpurnius",
-        "branch": "Piso",
-        "class": 1,
-        "husband": {"praenomen": "Gaius", "cognomen": "Piso", "birth": -283, "traits": ["Calculating", "Prudent"], "wealth": 4100, "influence": 5},
-        "wife": {"nomen": "Calpurnia", "cognomen": "Piso", "birth": -287, "traits": ["Patient", "Cultured"], "wealth": 3950, "influence": 4},
-        "sons": [
-            {"praenomen": "Lucius", "cognomen": "Piso", "birth": -268, "traits": ["Studious"], "wealth": 680, "influence": 3},
-            {"praenomen": "Marcus", "cognomen": "Piso", "birth": -265, "traits": ["Diligent"], "wealth": 660, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Piso", "birth": -262, "traits": ["Gentle"], "wealth": 640, "influence": 2},
-            {"cognomen": "Piso", "birth": -259, "traits": ["Insightful"], "wealth": 620, "influence": 2}
-        ]
-    },
-    {
-        "family": "Marcius",
-        "branch": "Rutilus",
-        "class": 1,
-        "husband": {"praenomen": "Gnaeus", "cognomen": "Rutilus", "birth": -284, "traits": ["Stout", "Loyal"], "wealth": 3900, "influence": 5},
-        "wife": {"nomen": "Marcia", "cognomen": "Rutila", "birth": -288, "traits": ["Kind", "Resolute"], "wealth": 3700, "influence": 4},
-        "sons": [
-            {"praenomen": "Quintus", "cognomen": "Rutilus", "birth": -268, "traits": ["Observant"], "wealth": 650, "influence": 3},
-            {"praenomen": "Titus", "cognomen": "Rutilus", "birth": -265, "traits": ["Energetic"], "wealth": 630, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Rutila", "birth": -262, "traits": ["Cheerful"], "wealth": 610, "influence": 2},
-            {"cognomen": "Rutila", "birth": -259, "traits": ["Patient"], "wealth": 600, "influence": 2}
-        ]
-    },
-    {
-        "family": "Livius",
-        "branch": "Salinator",
-        "class": 1,
-        "husband": {"praenomen": "Marcus", "cognomen": "Salinator", "birth": -285, "traits": ["Tenacious", "Calculating"], "wealth": 4000, "influence": 6},
-        "wife": {"nomen": "Livia", "cognomen": "Salinatrix", "birth": -289, "traits": ["Vigilant", "Pious"], "wealth": 3800, "influence": 4},
-        "sons": [
-            {"praenomen": "Gaius", "cognomen": "Salinator", "birth": -268, "traits": ["Determined"], "wealth": 670, "influence": 3},
-            {"praenomen": "Marcus", "cognomen": "Salinator", "birth": -265, "traits": ["Studious"], "wealth": 650, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Salinatrix", "birth": -262, "traits": ["Graceful"], "wealth": 630, "influence": 2},
-            {"cognomen": "Salinatrix", "birth": -259, "traits": ["Attentive"], "wealth": 610, "influence": 2}
-        ]
-    },
-    {
-        "family": "Licinius",
-        "branch": "Crassus",
-        "class": 1,
-        "husband": {"praenomen": "Publius", "cognomen": "Crassus", "birth": -283, "traits": ["Shrewd", "Ambitious"], "wealth": 4200, "influence": 6},
-        "wife": {"nomen": "Licinia", "cognomen": "Crassa", "birth": -287, "traits": ["Supportive", "Insightful"], "wealth": 4050, "influence": 4},
-        "sons": [
-            {"praenomen": "Marcus", "cognomen": "Crassus", "birth": -268, "traits": ["Calculating"], "wealth": 690, "influence": 3},
-            {"praenomen": "Gaius", "cognomen": "Crassus", "birth": -265, "traits": ["Confident"], "wealth": 670, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Crassa", "birth": -262, "traits": ["Poised"], "wealth": 650, "influence": 2},
-            {"cognomen": "Crassa", "birth": -259, "traits": ["Clever"], "wealth": 630, "influence": 2}
-        ]
-    },
-    {
-        "family": "Antonius",
-        "branch": "Merenda",
-        "class": 2,
-        "husband": {"praenomen": "Marcus", "cognomen": "Merenda", "birth": -282, "traits": ["Industrious", "Assertive"], "wealth": 3000, "influence": 4},
-        "wife": {"nomen": "Antonia", "cognomen": "Merenda", "birth": -286, "traits": ["Patient", "Practical"], "wealth": 2800, "influence": 3},
-        "sons": [
-            {"praenomen": "Gaius", "cognomen": "Merenda", "birth": -267, "traits": ["Earnest"], "wealth": 520, "influence": 2},
-            {"praenomen": "Lucius", "cognomen": "Merenda", "birth": -264, "traits": ["Thoughtful"], "wealth": 500, "influence": 2}
-        ],
-        "daughters": [
-            {"cognomen": "Merenda", "birth": -262, "traits": ["Helpful"], "wealth": 480, "influence": 1},
-            {"cognomen": "Merenda", "birth": -259, "traits": ["Cheerful"], "wealth": 460, "influence": 1}
-        ]
-    },
-    {
-        "family": "Plautius",
-        "branch": "Hypsaeus",
-        "class": 1,
-        "husband": {"praenomen": "Gaius", "cognomen": "Hypsaeus", "birth": -284, "traits": ["Decisive", "Charismatic"], "wealth": 3600, "influence": 5},
-        "wife": {"nomen": "Plautia", "cognomen": "Hypsaea", "birth": -288, "traits": ["Diplomatic", "Pious"], "wealth": 3400, "influence": 4},
-        "sons": [
-            {"praenomen": "Marcus", "cognomen": "Hypsaeus", "birth": -268, "traits": ["Confident"], "wealth": 610, "influence": 3},
-            {"praenomen": "Publius", "cognomen": "Hypsaeus", "birth": -265, "traits": ["Alert"], "wealth": 590, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Hypsaea", "birth": -262, "traits": ["Calm"], "wealth": 570, "influence": 2},
-            {"cognomen": "Hypsaea", "birth": -259, "traits": ["Kind"], "wealth": 550, "influence": 2}
-        ]
-    },
-    {
-        "family": "Mucius",
-        "branch": "Scaevola",
-        "class": 0,
-        "husband": {"praenomen": "Publius", "cognomen": "Scaevola", "birth": -287, "traits": ["Judicious", "Calm"], "wealth": 5200, "influence": 7},
-        "wife": {"nomen": "Mucia", "cognomen": "Scaevola", "birth": -291, "traits": ["Pious", "Perceptive"], "wealth": 5000, "influence": 5},
-        "sons": [
-            {"praenomen": "Quintus", "cognomen": "Scaevola", "birth": -268, "traits": ["Meticulous"], "wealth": 820, "influence": 3},
-            {"praenomen": "Lucius", "cognomen": "Scaevola", "birth": -265, "traits": ["Insightful"], "wealth": 800, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Scaevola", "birth": -262, "traits": ["Gentle"], "wealth": 780, "influence": 2},
-            {"cognomen": "Scaevola", "birth": -259, "traits": ["Cautious"], "wealth": 760, "influence": 2}
-        ]
-    },
-    {
-        "family": "Tullius",
-        "branch": "Rufus",
-        "class": 2,
-        "husband": {"praenomen": "Marcus", "cognomen": "Rufus", "birth": -282, "traits": ["Diligent", "Pragmatic"], "wealth": 3100, "influence": 4},
-        "wife": {"nomen": "Tullia", "cognomen": "Rufa", "birth": -286, "traits": ["Cheerful", "Kind"], "wealth": 2900, "influence": 3},
-        "sons": [
-            {"praenomen": "Lucius", "cognomen": "Rufus", "birth": -267, "traits": ["Studious"], "wealth": 520, "influence": 2},
-            {"praenomen": "Publius", "cognomen": "Rufus", "birth": -264, "traits": ["Calm"], "wealth": 500, "influence": 2}
-        ],
-        "daughters": [
-            {"cognomen": "Rufa", "birth": -262, "traits": ["Helpful"], "wealth": 480, "influence": 1},
-            {"cognomen": "Rufa", "birth": -259, "traits": ["Curious"], "wealth": 460, "influence": 1}
-        ]
-    },
-    {
-        "family": "Hostilius",
-        "branch": "Mancinus",
-        "class": 1,
-        "husband": {"praenomen": "Aulus", "cognomen": "Mancinus", "birth": -284, "traits": ["Courageous", "Determined"], "wealth": 3600, "influence": 5},
-        "wife": {"nomen": "Hostilia", "cognomen": "Mancina", "birth": -288, "traits": ["Steadfast", "Pious"], "wealth": 3400, "influence": 4},
-        "sons": [
-            {"praenomen": "Lucius", "cognomen": "Mancinus", "birth": -268, "traits": ["Brave"], "wealth": 600, "influence": 3},
-            {"praenomen": "Quintus", "cognomen": "Mancinus", "birth": -265, "traits": ["Thoughtful"], "wealth": 580, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Mancina", "birth": -262, "traits": ["Loyal"], "wealth": 560, "influence": 2},
-            {"cognomen": "Mancina", "birth": -259, "traits": ["Kind"], "wealth": 540, "influence": 2}
-        ]
-    },
-    {
-        "family": "Furius",
-        "branch": "Camillus",
-        "class": 0,
-        "husband": {"praenomen": "Lucius", "cognomen": "Camillus", "birth": -287, "traits": ["Strategic", "Calm"], "wealth": 5100, "influence": 7},
-        "wife": {"nomen": "Furia", "cognomen": "Camilla", "birth": -292, "traits": ["Wise", "Kind"], "wealth": 4900, "influence": 5},
-        "sons": [
-            {"praenomen": "Marcus", "cognomen": "Camillus", "birth": -268, "traits": ["Courageous"], "wealth": 820, "influence": 3},
-            {"praenomen": "Gaius", "cognomen": "Camillus", "birth": -266, "traits": ["Studious"], "wealth": 800, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Camilla", "birth": -263, "traits": ["Gentle"], "wealth": 780, "influence": 2},
-            {"cognomen": "Camilla", "birth": -260, "traits": ["Curious"], "wealth": 760, "influence": 2}
-        ]
-    },
-    {
-        "family": "Atilius",
-        "branch": "Calatinus",
-        "class": 1,
-        "husband": {"praenomen": "Gaius", "cognomen": "Calatinus", "birth": -285, "traits": ["Vigorous", "Resolute"], "wealth": 3800, "influence": 5},
-        "wife": {"nomen": "Atilia", "cognomen": "Calatina", "birth": -289, "traits": ["Patient", "Pious"], "wealth": 3600, "influence": 4},
-        "sons": [
-            {"praenomen": "Marcus", "cognomen": "Calatinus", "birth": -268, "traits": ["Determined"], "wealth": 620, "influence": 3},
-            {"praenomen": "Lucius", "cognomen": "Calatinus", "birth": -265, "traits": ["Prudent"], "wealth": 600, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Calatina", "birth": -262, "traits": ["Caring"], "wealth": 580, "influence": 2},
-            {"cognomen": "Calatina", "birth": -259, "traits": ["Cheerful"], "wealth": 560, "influence": 2}
-        ]
-    },
-    {
-        "family": "Ogulnius",
-        "branch": "Gallus",
-        "class": 2,
-        "husband": {"praenomen": "Quintus", "cognomen": "Gallus", "birth": -283, "traits": ["Insightful", "Patient"], "wealth": 3200, "influence": 4},
-        "wife": {"nomen": "Ogulnia", "cognomen": "Galla", "birth": -287, "traits": ["Gentle", "Devout"], "wealth": 3000, "influence": 3},
-        "sons": [
-            {"praenomen": "Lucius", "cognomen": "Gallus", "birth": -267, "traits": ["Studious"], "wealth": 540, "influence": 2},
-            {"praenomen": "Marcus", "cognomen": "Gallus", "birth": -264, "traits": ["Bold"], "wealth": 520, "influence": 2}
-        ],
-        "daughters": [
-            {"cognomen": "Galla", "birth": -261, "traits": ["Kind"], "wealth": 500, "influence": 1},
-            {"cognomen": "Galla", "birth": -258, "traits": ["Curious"], "wealth": 480, "influence": 1}
-        ]
-    },
-    {
-        "family": "Minucius",
-        "branch": "Thermus",
-        "class": 1,
-        "husband": {"praenomen": "Quintus", "cognomen": "Thermus", "birth": -284, "traits": ["Alert", "Resourceful"], "wealth": 3700, "influence": 5},
-        "wife": {"nomen": "Minucia", "cognomen": "Therma", "birth": -288, "traits": ["Patient", "Organized"], "wealth": 3500, "influence": 4},
-        "sons": [
-            {"praenomen": "Lucius", "cognomen": "Thermus", "birth": -268, "traits": ["Inventive"], "wealth": 600, "influence": 3},
-            {"praenomen": "Publius", "cognomen": "Thermus", "birth": -265, "traits": ["Calm"], "wealth": 580, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Therma", "birth": -262, "traits": ["Kind"], "wealth": 560, "influence": 2},
-            {"cognomen": "Therma", "birth": -259, "traits": ["Observant"], "wealth": 540, "influence": 2}
-        ]
-    },
-    {
-        "family": "Quinctilius",
-        "branch": "Varus",
-        "class": 1,
-        "husband": {"praenomen": "Titus", "cognomen": "Varus", "birth": -283, "traits": ["Prudent", "Resolute"], "wealth": 3600, "influence": 5},
-        "wife": {"nomen": "Quinctilia", "cognomen": "Vara", "birth": -287, "traits": ["Gentle", "Perceptive"], "wealth": 3400, "influence": 4},
-        "sons": [
-            {"praenomen": "Lucius", "cognomen": "Varus", "birth": -267, "traits": ["Diligent"], "wealth": 590, "influence": 3},
-            {"praenomen": "Quintus", "cognomen": "Varus", "birth": -264, "traits": ["Calm"], "wealth": 570, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Vara", "birth": -261, "traits": ["Caring"], "wealth": 550, "influence": 2},
-            {"cognomen": "Vara", "birth": -258, "traits": ["Curious"], "wealth": 530, "influence": 2}
-        ]
-    },
-    {
-        "family": "Cornelius",
-        "branch": "Lentulus",
-        "class": 0,
-        "husband": {"praenomen": "Lucius", "cognomen": "Lentulus", "birth": -286, "traits": ["Shrewd", "Charismatic"], "wealth": 5400, "influence": 7},
-        "wife": {"nomen": "Cornelia", "cognomen": "Lentula", "birth": -290, "traits": ["Diplomatic", "Pious"], "wealth": 5200, "influence": 6},
-        "sons": [
-            {"praenomen": "Publius", "cognomen": "Lentulus", "birth": -269, "traits": ["Astute"], "wealth": 840, "influence": 3},
-            {"praenomen": "Gnaeus", "cognomen": "Lentulus", "birth": -266, "traits": ["Confident"], "wealth": 820, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Lentula", "birth": -263, "traits": ["Cultured"], "wealth": 800, "influence": 2},
-            {"cognomen": "Lentula", "birth": -260, "traits": ["Cheerful"], "wealth": 780, "influence": 2}
-        ]
-    },
-    {
-        "family": "Aemilius",
-        "branch": "Barbula",
-        "class": 0,
-        "husband": {"praenomen": "Marcus", "cognomen": "Barbula", "birth": -287, "traits": ["Resolute", "Strategic"], "wealth": 5300, "influence": 7},
-        "wife": {"nomen": "Aemilia", "cognomen": "Barbula", "birth": -292, "traits": ["Kind", "Wise"], "wealth": 5100, "influence": 5},
-        "sons": [
-            {"praenomen": "Lucius", "cognomen": "Barbula", "birth": -268, "traits": ["Diligent"], "wealth": 830, "influence": 3},
-            {"praenomen": "Marcus", "cognomen": "Barbula", "birth": -265, "traits": ["Bold"], "wealth": 810, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Barbula", "birth": -262, "traits": ["Gentle"], "wealth": 790, "influence": 2},
-            {"cognomen": "Barbula", "birth": -259, "traits": ["Perceptive"], "wealth": 770, "influence": 2}
-        ]
-    },
-    {
-        "family": "Fabia",
-        "branch": "Picta",
-        "class": 0,
-        "husband": {"praenomen": "Gaius", "cognomen": "Pictor", "birth": -288, "traits": ["Artistic", "Studious"], "wealth": 5000, "influence": 6},
-        "wife": {"nomen": "Fabia", "cognomen": "Picta", "birth": -292, "traits": ["Cultured", "Pious"], "wealth": 4800, "influence": 5},
-        "sons": [
-            {"praenomen": "Quintus", "cognomen": "Pictor", "birth": -268, "traits": ["Creative"], "wealth": 790, "influence": 3},
-            {"praenomen": "Marcus", "cognomen": "Pictor", "birth": -265, "traits": ["Diligent"], "wealth": 770, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Picta", "birth": -262, "traits": ["Artistic"], "wealth": 750, "influence": 2},
-            {"cognomen": "Picta", "birth": -259, "traits": ["Gentle"], "wealth": 730, "influence": 2}
-        ]
-    },
-    {
-        "family": "Claudia",
-        "branch": "Centho",
-        "class": 0,
-        "husband": {"praenomen": "Gaius", "cognomen": "Centho", "birth": -287, "traits": ["Charismatic", "Strategic"], "wealth": 5200, "influence": 7},
-        "wife": {"nomen": "Claudia", "cognomen": "Centho", "birth": -291, "traits": ["Proud", "Insightful"], "wealth": 5000, "influence": 6},
-        "sons": [
-            {"praenomen": "Appius", "cognomen": "Centho", "birth": -268, "traits": ["Determined"], "wealth": 820, "influence": 3},
-            {"praenomen": "Publius", "cognomen": "Centho", "birth": -265, "traits": ["Diplomatic"], "wealth": 800, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Centho", "birth": -262, "traits": ["Elegant"], "wealth": 780, "influence": 2},
-            {"cognomen": "Centho", "birth": -259, "traits": ["Gentle"], "wealth": 760, "influence": 2}
-        ]
-    },
-    {
-        "family": "Curtius",
-        "branch": "Philippus",
-        "class": 0,
-        "husband": {"praenomen": "Gaius", "cognomen": "Philippus", "birth": -286, "traits": ["Astute", "Calm"], "wealth": 5100, "influence": 6},
-        "wife": {"nomen": "Curtia", "cognomen": "Philippa", "birth": -290, "traits": ["Nurturing", "Wise"], "wealth": 4900, "influence": 5},
-        "sons": [
-            {"praenomen": "Lucius", "cognomen": "Philippus", "birth": -268, "traits": ["Prudent"], "wealth": 800, "influence": 3},
-            {"praenomen": "Marcus", "cognomen": "Philippus", "birth": -265, "traits": ["Confident"], "wealth": 780, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Philippa", "birth": -262, "traits": ["Gentle"], "wealth": 760, "influence": 2},
-            {"cognomen": "Philippa", "birth": -259, "traits": ["Curious"], "wealth": 740, "influence": 2}
-        ]
-    },
-    {
-        "family": "Curtius",
-        "branch": "Rufinus",
-        "class": 0,
-        "husband": {"praenomen": "Marcus", "cognomen": "Rufinus", "birth": -288, "traits": ["Resolute", "Courageous"], "wealth": 5000, "influence": 6},
-        "wife": {"nomen": "Curtia", "cognomen": "Rufina", "birth": -292, "traits": ["Pious", "Kind"], "wealth": 4800, "influence": 5},
-        "sons": [
-            {"praenomen": "Gaius", "cognomen": "Rufinus", "birth": -269, "traits": ["Bold"], "wealth": 790, "influence": 3},
-            {"praenomen": "Lucius", "cognomen": "Rufinus", "birth": -266, "traits": ["Steady"], "wealth": 770, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Rufina", "birth": -263, "traits": ["Attentive"], "wealth": 750, "influence": 2},
-            {"cognomen": "Rufina", "birth": -260, "traits": ["Cheerful"], "wealth": 730, "influence": 2}
-        ]
-    },
-    {
-        "family": "Trebonius",
-        "branch": "Varro",
-        "class": 2,
-        "husband": {"praenomen": "Gaius", "cognomen": "Varro", "birth": -282, "traits": ["Organized", "Patient"], "wealth": 3100, "influence": 4},
-        "wife": {"nomen": "Trebonia", "cognomen": "Varra", "birth": -286, "traits": ["Kind", "Devout"], "wealth": 2900, "influence": 3},
-        "sons": [
-            {"praenomen": "Lucius", "cognomen": "Varro", "birth": -267, "traits": ["Curious"], "wealth": 520, "influence": 2},
-            {"praenomen": "Marcus", "cognomen": "Varro", "birth": -264, "traits": ["Determined"], "wealth": 500, "influence": 2}
-        ],
-        "daughters": [
-            {"cognomen": "Varra", "birth": -261, "traits": ["Cheerful"], "wealth": 480, "influence": 1},
-            {"cognomen": "Varra", "birth": -258, "traits": ["Gentle"], "wealth": 460, "influence": 1}
-        ]
-    },
-    {
-        "family": "Plautia",
-        "branch": "Plautius",
-        "class": 1,
-        "husband": {"praenomen": "Aulus", "cognomen": "Plautius", "birth": -284, "traits": ["Decisive", "Cautious"], "wealth": 3700, "influence": 5},
-        "wife": {"nomen": "Plautia", "cognomen": "Plautina", "birth": -288, "traits": ["Devout", "Patient"], "wealth": 3500, "influence": 4},
-        "sons": [
-            {"praenomen": "Quintus", "cognomen": "Plautius", "birth": -268, "traits": ["Steady"], "wealth": 600, "influence": 3},
-            {"praenomen": "Lucius", "cognomen": "Plautius", "birth": -265, "traits": ["Calm"], "wealth": 580, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Plautina", "birth": -262, "traits": ["Kind"], "wealth": 560, "influence": 2},
-            {"cognomen": "Plautina", "birth": -259, "traits": ["Cheerful"], "wealth": 540, "influence": 2}
-        ]
-    },
-    {
-        "family": "Decius",
-        "branch": "Mus",
-        "class": 1,
-        "husband": {"praenomen": "Publius", "cognomen": "Mus", "birth": -285, "traits": ["Courageous", "Devout"], "wealth": 3800, "influence": 5},
-        "wife": {"nomen": "Decia", "cognomen": "Musa", "birth": -289, "traits": ["Compassionate", "Pious"], "wealth": 3600, "influence": 4},
-        "sons": [
-            {"praenomen": "Quintus", "cognomen": "Mus", "birth": -268, "traits": ["Brave"], "wealth": 610, "influence": 3},
-            {"praenomen": "Publius", "cognomen": "Mus", "birth": -265, "traits": ["Disciplined"], "wealth": 590, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Musa", "birth": -262, "traits": ["Kind"], "wealth": 570, "influence": 2},
-            {"cognomen": "Musa", "birth": -259, "traits": ["Curious"], "wealth": 550, "influence": 2}
-        ]
-    },
-    {
-        "family": "Cornelius",
-        "branch": "Cethegus",
-        "class": 0,
-        "husband": {"praenomen": "Gaius", "cognomen": "Cethegus", "birth": -286, "traits": ["Astute", "Eloquent"], "wealth": 5300, "influence": 7},
-        "wife": {"nomen": "Cornelia", "cognomen": "Cethega", "birth": -291, "traits": ["Diplomatic", "Pious"], "wealth": 5100, "influence": 6},
-        "sons": [
-            {"praenomen": "Marcus", "cognomen": "Cethegus", "birth": -268, "traits": ["Persuasive"], "wealth": 820, "influence": 3},
-            {"praenomen": "Lucius", "cognomen": "Cethegus", "birth": -265, "traits": ["Steady"], "wealth": 800, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Cethega", "birth": -262, "traits": ["Graceful"], "wealth": 780, "influence": 2},
-            {"cognomen": "Cethega", "birth": -259, "traits": ["Insightful"], "wealth": 760, "influence": 2}
-        ]
-    },
-    {
-        "family": "Sicinius",
-        "branch": "Dentatus",
-        "class": 2,
-        "husband": {"praenomen": "Lucius", "cognomen": "Dentatus", "birth": -282, "traits": ["Resolute", "Hardy"], "wealth": 3200, "influence": 4},
-        "wife": {"nomen": "Sicinia", "cognomen": "Dentata", "birth": -286, "traits": ["Practical", "Kind"], "wealth": 3000, "influence": 3},
-        "sons": [
-            {"praenomen": "Marcus", "cognomen": "Dentatus", "birth": -267, "traits": ["Energetic"], "wealth": 540, "influence": 2},
-            {"praenomen": "Publius", "cognomen": "Dentatus", "birth": -264, "traits": ["Sturdy"], "wealth": 520, "influence": 2}
-        ],
-        "daughters": [
-            {"cognomen": "Dentata", "birth": -261, "traits": ["Warm"], "wealth": 500, "influence": 1},
-            {"cognomen": "Dentata", "birth": -258, "traits": ["Cheerful"], "wealth": 480, "influence": 1}
-        ]
-    },
-    {
-        "family": "Sestius",
-        "branch": "Capitolinus",
-        "class": 1,
-        "husband": {"praenomen": "Publius", "cognomen": "Capitolinus", "birth": -284, "traits": ["Dignified", "Resolute"], "wealth": 3700, "influence": 5},
-        "wife": {"nomen": "Sestia", "cognomen": "Capitolina", "birth": -288, "traits": ["Pious", "Cultured"], "wealth": 3500, "influence": 4},
-        "sons": [
-            {"praenomen": "Lucius", "cognomen": "Capitolinus", "birth": -268, "traits": ["Calm"], "wealth": 600, "influence": 3},
-            {"praenomen": "Gaius", "cognomen": "Capitolinus", "birth": -265, "traits": ["Astute"], "wealth": 580, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Capitolina", "birth": -262, "traits": ["Gentle"], "wealth": 560, "influence": 2},
-            {"cognomen": "Capitolina", "birth": -259, "traits": ["Diligent"], "wealth": 540, "influence": 2}
-        ]
-    },
-    {
-        "family": "Verginius",
-        "branch": "Tricostus",
-        "class": 1,
-        "husband": {"praenomen": "Aulus", "cognomen": "Tricostus", "birth": -285, "traits": ["Resolute", "Cautious"], "wealth": 3600, "influence": 5},
-        "wife": {"nomen": "Verginia", "cognomen": "Tricosta", "birth": -289, "traits": ["Kind", "Pious"], "wealth": 3400, "influence": 4},
-        "sons": [
-            {"praenomen": "Lucius", "cognomen": "Tricostus", "birth": -268, "traits": ["Steady"], "wealth": 590, "influence": 3},
-            {"praenomen": "Titus", "cognomen": "Tricostus", "birth": -265, "traits": ["Alert"], "wealth": 570, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Tricosta", "birth": -262, "traits": ["Gentle"], "wealth": 550, "influence": 2},
-            {"cognomen": "Tricosta", "birth": -259, "traits": ["Cheerful"], "wealth": 530, "influence": 2}
-        ]
-    },
-    {
-        "family": "Atilius",
-        "branch": "Regulus",
-        "class": 1,
-        "husband": {"praenomen": "Marcus", "cognomen": "Regulus", "birth": -284, "traits": ["Bold", "Resilient"], "wealth": 3750, "influence": 5},
-        "wife": {"nomen": "Atilia", "cognomen": "Regula", "birth": -288, "traits": ["Devout", "Steadfast"], "wealth": 3550, "influence": 4},
-        "sons": [
-            {"praenomen": "Gaius", "cognomen": "Regulus", "birth": -267, "traits": ["Energetic"], "wealth": 600, "influence": 3},
-            {"praenomen": "Marcus", "cognomen": "Regulus", "birth": -264, "traits": ["Determined"], "wealth": 580, "influence": 3}
-        ],
-        "daughters": [
-            {"cognomen": "Regula", "birth": -261, "traits": ["Pious"], "wealth": 560, "influence": 2},
-            {"cognomen": "Regula", "birth": -258, "traits": ["Gentle"], "wealth": 540, "influence": 2}
-        ]
-    }
-]
+FAMILIES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "families.tsv")
+
+
+class Person(NamedTuple):
+    cognomen: str
+    birth: int
+    traits: Tuple[str, ...]
+    wealth: int
+    influence: int
+    praenomen: Optional[str] = None
+    nomen: Optional[str] = None
+
+
+class Family(NamedTuple):
+    family: str
+    branch: str
+    social_class: int
+    husband: Person
+    wife: Person
+    sons: Tuple[Person, ...]
+    daughters: Tuple[Person, ...]
+
+
+_TRAITSET_POOL = {}
+
+
+def _traits(names):
+    """Return the shared tuple for a trait set, interning each trait name."""
+    key = tuple(names)
+    shared = _TRAITSET_POOL.get(key)
+    if shared is None:
+        shared = tuple(sys.intern(name) for name in key)
+        _TRAITSET_POOL[key] = shared
+    return shared
+
+
+_TRAIT_COLUMN_POOL = {}
+
+
+def _traits_from_column(text):
+    """Return the shared trait tuple for a raw ``families.tsv`` traits cell.
+
+    Cells are pooled by their text, so repeated cells such as ``Gentle`` skip the
+    split and tuple building entirely. An empty cell means no traits.
+    """
+    shared = _TRAIT_COLUMN_POOL.get(text)
+    if shared is None:
+        shared = _traits(text.split("|") if text else ())
+        _TRAIT_COLUMN_POOL[text] = shared
+    return shared
+
+
+def _name(value):
+    """Intern a name column so repeated names share one string; blanks become ``None``."""
+    return sys.intern(value) if value else None
+
+
+_PERSON_COLUMNS = ("praenomen", "nomen", "cognomen", "birth", "traits", "wealth", "influence")
+
+
+def _read_person(praenomen, nomen, cognomen, birth, traits, wealth, influence):
+    return Person(
+        cognomen=_name(cognomen),
+        birth=int(birth),
+        traits=_traits_from_column(traits),
+        wealth=int(wealth),
+        influence=int(influence),
+        praenomen=_name(praenomen),
+        nomen=_name(nomen),
+    )
+
+
+def build_families(path=FAMILIES_PATH):
+    """Read the household table and group its rows into ``Family`` records.
+
+    Consecutive rows sharing a ``family``/``branch`` pair form one household made
+    of a husband, a wife, and any number of sons and daughters. Rows are consumed
+    as they are read and accessed by column position. A household with an unknown
+    role, a class that differs between rows, or other than one husband and one
+    wife raises ``ValueError`` naming the household and line.
+    """
+    families = []
+    with open(path, newline="") as f:
+        rows = csv.reader(f, delimiter="\t")
+        column = {name: index for index, name in enumerate(next(rows))}
+        household_of = itemgetter(column["family"], column["branch"])
+        person_fields = itemgetter(*(column[name] for name in _PERSON_COLUMNS))
+        class_column = column["class"]
+        role_column = column["role"]
+
+        for (family_name, branch), members in groupby(rows, key=household_of):
+            # groupby has already read the household's first row.
+            first_line = rows.line_num
+            by_role = {"husband": [], "wife": [], "son": [], "daughter": []}
+            social_class = None
+            for row in members:
+                role = row[role_column]
+                if role not in by_role:
+                    raise ValueError(f"{path}:{rows.line_num}: unknown role {role!r} "
+                                     f"in {family_name} {branch}")
+                row_class = int(row[class_column])
+                if social_class is None:
+                    social_class = row_class
+                elif row_class != social_class:
+                    raise ValueError(f"{path}:{rows.line_num}: class {row_class} differs from "
+                                     f"class {social_class} of {family_name} {branch}")
+                by_role[role].append(_read_person(*person_fields(row)))
+            for role in ("husband", "wife"):
+                if len(by_role[role]) != 1:
+                    raise ValueError(f"{path}:{first_line}: {family_name} {branch} has "
+                                     f"{len(by_role[role])} {role} rows, expected 1")
+            families.append(Family(
+                family=sys.intern(family_name),
+                branch=sys.intern(branch),
+                social_class=social_class,
+                husband=by_role["husband"][0],
+                wife=by_role["wife"][0],
+                sons=tuple(by_role["son"]),
+                daughters=tuple(by_role["daughter"]),
+            ))
+    return families
 
-# Additional families will be appended later.
 
 male_birth_sequence = [1, 5, 9, 3, 7, 11]
 female_birth_sequence = [4, 8, 12, 2, 6, 10]
@@ -662,127 +178,448 @@ traits_pool = [
 male_birth_month = 3
 female_birth_month = 7
 
-def generate_characters(output_path="generated_characters.json"):
-    characters = []
-    next_id = 1
-
-    def add_character(name_data, gender, birth_year, wealth, influence, family, social_class,
-                      traits, spouse_id=None, father_id=None, mother_id=None):
-        nonlocal next_id
-        age = START_YEAR - birth_year
-        record = {
-            "ID": next_id,
-            "RomanName": name_data,
-            "Gender": gender,
-            "BirthYear": birth_year,
-            "BirthMonth": male_birth_month if gender == 0 else female_birth_month,
-            "BirthDay": 12 if gender == 0 else 6,
-            "Age": age,
-            "IsAlive": True,
-            "SpouseID": spouse_id,
-            "FatherID": father_id,
-            "MotherID": mother_id,
-            "SiblingID": None,
-            "Family": family,
-            "Class": social_class,
-            "Traits": traits,
-            "Wealth": wealth,
-            "Influence": influence
-        }
-        characters.append(record)
-        next_id += 1
-        return record
-
-    for family in families:
-        social_class = family["class"]
-        nomen = family["family"]
-
-        husband_name = {
-            "Praenomen": family["husband"]["praenomen"],
-            "Nomen": nomen,
-            "Cognomen": family["husband"]["cognomen"],
-            "Gender": 0
-        }
-        husband = add_character(
-            husband_name,
-            0,
-            family["husband"]["birth"],
-            family["husband"]["wealth"],
-            family["husband"]["influence"],
-            nomen,
-            social_class,
-            family["husband"]["traits"]
-        )
-
-        wife_name = {
-            "Praenomen": None,
-            "Nomen": family["wife"]["nomen"],
-            "Cognomen": family["wife"]["cognomen"],
-            "Gender": 1
-        }
-        wife = add_character(
-            wife_name,
-            1,
-            family["wife"]["birth"],
-            family["wife"]["wealth"],
-            family["wife"]["influence"],
-            nomen,
-            social_class,
-            family["wife"]["traits"]
-        )
-
-        husband["SpouseID"] = wife["ID"]
-        wife["SpouseID"] = husband["ID"]
-
-        for son in family["sons"]:
-            son_name = {
-                "Praenomen": son["praenomen"],
-                "Nomen": nomen,
-                "Cognomen": son["cognomen"],
-                "Gender": 0
-            }
-            add_character(
-                son_name,
-                0,
-                son["birth"],
-                son["wealth"],
-                son["influence"],
-                nomen,
-                social_class,
-                son["traits"],
-                father_id=husband["ID"],
-                mother_id=wife["ID"]
-            )
-
-        for daughter in family["daughters"]:
-            daughter_name = {
-                "Praenomen": None,
-                "Nomen": family["wife"]["nomen"],
-                "Cognomen": daughter["cognomen"],
-                "Gender": 1
-            }
-            add_character(
-                daughter_name,
-                1,
-                daughter["birth"],
-                daughter["wealth"],
-                daughter["influence"],
-                nomen,
-                social_class,
-                daughter["traits"],
-                father_id=husband["ID"],
-                mother_id=wife["ID"]
-            )
-
-    output = {"Characters": characters}
-
-    with open(output_path, "w") as f:
-        json.dump(output, f, indent=2)
-
-    print(f"Created {len(characters)} characters")
-
-    return output
+# Rosters with at least this many families are formatted on a process pool.
+PARALLEL_FAMILY_THRESHOLD = 256
+
+# Thread switch interval, in seconds, while the roster is rendered.
+RENDER_SWITCH_INTERVAL = 0.05
+
+# Most chunks a single ``os.writev`` call accepts on Linux and macOS.
+_IOV_MAX = 1024
+
+
+def _json_string(value):
+    # The C string escaper json.dumps uses for ASCII output, without its per-call setup.
+    return "null" if value is None else encode_basestring_ascii(value)
+
+
+# One ``Characters`` entry laid out exactly as ``json.dump(indent=2)`` writes it.
+_CHARACTER_TEMPLATE = """\
+    {{
+      "ID": {id},
+      "RomanName": {{
+        "Praenomen": {praenomen},
+        "Nomen": {nomen},
+        "Cognomen": {cognomen},
+        "Gender": {gender}
+      }},
+      "Gender": {gender},
+      "BirthYear": {birth},
+      "BirthMonth": {birth_month},
+      "BirthDay": {birth_day},
+      "Age": {age},
+      "IsAlive": true,
+      "SpouseID": {spouse_id},
+      "FatherID": {father_id},
+      "MotherID": {mother_id},
+      "SiblingID": null,
+      "Family": {family},
+      "Class": {social_class},
+      "Traits": {traits},
+      "Wealth": {wealth},
+      "Influence": {influence}
+    }}"""
+
+
+class _Layout(NamedTuple):
+    templates: Tuple[str, str]
+    traits_open: str
+    traits_separator: str
+    traits_close: str
+    entry_separator: str
+    head: str
+    first_family_prefix: str
+    family_separator: str
+    tail: str
+    empty_tail: str
+
+
+def _single_line(template):
+    """Collapse an indented entry template to one line, spaced like ``json.dumps``."""
+    joined = " ".join(line.strip() for line in template.splitlines())
+    return joined.replace("{{ ", "{{").replace(" }}", "}}")
+
+
+# Per-character template fields, in the order ``_format_character`` passes them.
+_CHARACTER_FIELDS = (
+    "id", "praenomen", "nomen", "cognomen", "birth", "age", "spouse_id", "father_id",
+    "mother_id", "family", "social_class", "traits", "wealth", "influence",
+)
+
+
+def _positional(template):
+    """Rewrite named fields as positional indices following ``_CHARACTER_FIELDS``."""
+    for index, field in enumerate(_CHARACTER_FIELDS):
+        template = template.replace("{" + field + "}", "{" + str(index) + "}")
+    return template
+
+
+def _gender_templates(template):
+    """Return the entry template pre-filled with the fields fixed by gender, indexed by gender.
+
+    The remaining fields become positional, so each entry is filled from the call's
+    argument tuple rather than a per-character mapping.
+    """
+    return tuple(
+        _positional(template.replace("{gender}", str(gender))
+                            .replace("{birth_month}", str(birth_month))
+                            .replace("{birth_day}", str(birth_day)))
+        for gender, birth_month, birth_day in ((0, male_birth_month, 12), (1, female_birth_month, 6))
+    )
+
+
+# Matches ``json.dump({"Characters": [...]}, f, indent=2)``.
+_INDENTED_LAYOUT = _Layout(
+    templates=_gender_templates(_CHARACTER_TEMPLATE),
+    traits_open="[\n        ",
+    traits_separator=",\n        ",
+    traits_close="\n      ]",
+    entry_separator=",\n",
+    head='{\n  "Characters": [',
+    first_family_prefix="\n",
+    family_separator=",\n",
+    tail="\n  ]\n}",
+    empty_tail="]\n}",
+)
+
+# One line per family holding that family's entries, for compact, diff-friendly output.
+_FAMILY_LINES_LAYOUT = _Layout(
+    templates=_gender_templates(_single_line(_CHARACTER_TEMPLATE)),
+    traits_open="[",
+    traits_separator=", ",
+    traits_close="]",
+    entry_separator=", ",
+    head='{"Characters": [',
+    first_family_prefix="\n  ",
+    family_separator=",\n  ",
+    tail="\n]}",
+    empty_tail="]}",
+)
+
+# Minimal separators, like ``json.dumps(..., separators=(",", ":"))``; for machine consumers.
+_COMPACT_LAYOUT = _Layout(
+    templates=_gender_templates(
+        _single_line(_CHARACTER_TEMPLATE).replace(": ", ":").replace(", ", ",")),
+    traits_open="[",
+    traits_separator=",",
+    traits_close="]",
+    entry_separator=",",
+    head='{"Characters":[',
+    first_family_prefix="",
+    family_separator=",",
+    tail="]}",
+    empty_tail="]}",
+)
+
+_TRAITS_JSON = {}
+
+
+def _format_traits(traits, layout):
+    """Return the formatted ``Traits`` array, computed once per trait set and layout."""
+    key = (layout, traits)
+    formatted = _TRAITS_JSON.get(key)
+    if formatted is None:
+        if traits:
+            formatted = (layout.traits_open
+                         + layout.traits_separator.join(map(encode_basestring_ascii, traits))
+                         + layout.traits_close)
+        else:
+            formatted = "[]"
+        _TRAITS_JSON[key] = formatted
+    return formatted
+
+
+def _format_character(layout, start_year, character_id, praenomen, nomen, cognomen, gender,
+                      person, family, social_class, spouse_id="null", father_id="null",
+                      mother_id="null"):
+    """Format one entry; name, family and relation arguments arrive already rendered as JSON."""
+    return layout.templates[gender].format(
+        character_id,
+        praenomen,
+        nomen,
+        cognomen,
+        person.birth,
+        start_year - person.birth,
+        spouse_id,
+        father_id,
+        mother_id,
+        family,
+        social_class,
+        _format_traits(person.traits, layout),
+        person.wealth,
+        person.influence,
+    )
+
+
+def _family_size(family):
+    return 2 + len(family.sons) + len(family.daughters)
+
+
+def _format_family(family, first_id, layout=_INDENTED_LAYOUT, start_year=START_YEAR):
+    """Format every character of ``family``, numbering them from ``first_id``.
+
+    IDs follow the household order (husband, wife, sons, daughters), so each
+    entry's ID and parent IDs are known up front and written into a
+    preallocated slot. The couple's IDs are the only values the relation
+    columns ever hold, and the household's nomina are shared by every member,
+    so they are rendered once per household.
+    """
+    husband = family.husband
+    wife = family.wife
+    nomen = _json_string(family.family)
+    wife_nomen = _json_string(wife.nomen)
+    social_class = family.social_class
+    husband_id = str(first_id)
+    wife_id = str(first_id + 1)
+    first_son = 2
+    first_daughter = first_son + len(family.sons)
+
+    entries = [None] * _family_size(family)
+    entries[0] = _format_character(layout, start_year, first_id,
+                                   _json_string(husband.praenomen), nomen,
+                                   _json_string(husband.cognomen),
+                                   0, husband, nomen, social_class, spouse_id=wife_id)
+    entries[1] = _format_character(layout, start_year, first_id + 1,
+                                   "null", wife_nomen, _json_string(wife.cognomen),
+                                   1, wife, nomen, social_class, spouse_id=husband_id)
+    for index, son in enumerate(family.sons, first_son):
+        entries[index] = _format_character(layout, start_year, first_id + index,
+                                           _json_string(son.praenomen), nomen,
+                                           _json_string(son.cognomen),
+                                           0, son, nomen, social_class,
+                                           father_id=husband_id, mother_id=wife_id)
+    for index, daughter in enumerate(family.daughters, first_daughter):
+        entries[index] = _format_character(layout, start_year, first_id + index,
+                                           "null", wife_nomen, _json_string(daughter.cognomen),
+                                           1, daughter, nomen, social_class,
+                                           father_id=husband_id, mother_id=wife_id)
+    return layout.entry_separator.join(entries)
+
+
+def _format_families(families, layout=_INDENTED_LAYOUT, start_year=START_YEAR, parallel=None,
+                     mp_context=None):
+    """Format each family with IDs assigned by a prefix sum over the household sizes.
+
+    Families are independent once their first ID is known, so large rosters are
+    spread across worker processes; results keep the roster order either way.
+    ``parallel`` forces the choice, which otherwise follows
+    ``PARALLEL_FAMILY_THRESHOLD``. Everything a family needs is passed along with
+    it, since worker processes may re-import this module rather than inherit the
+    caller's globals.
+    """
+    if parallel is None:
+        parallel = len(families) >= PARALLEL_FAMILY_THRESHOLD
+    first_ids = accumulate(map(_family_size, families), initial=1)
+    args = (families, first_ids, repeat(layout), repeat(start_year))
+    if parallel:
+        with ProcessPoolExecutor(mp_context=mp_context) as executor:
+            return list(executor.map(_format_family, *args, chunksize=8))
+    return list(map(_format_family, *args))
+
+
+def _write_all(fd, data):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _read_exactly(fd, size):
+    parts = []
+    while size:
+        block = os.read(fd, size)
+        if not block:
+            break
+        parts.append(block)
+        size -= len(block)
+    return b"".join(parts)
+
+
+def _file_matches(path, chunks):
+    """Return True when ``path`` already holds exactly the concatenated ``chunks``.
+
+    The file is read straight from its descriptor and compared chunk by chunk,
+    stopping at the first difference.
+    """
+    try:
+        if os.path.getsize(path) != sum(map(len, chunks)):
+            return False
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except OSError:
+        return False
+    try:
+        return all(_read_exactly(fd, len(chunk)) == chunk for chunk in chunks)
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+
+def _write_chunks(path, chunks):
+    """Write encoded chunks to ``path`` with as few system calls as possible.
+
+    Uses a single gather write where ``os.writev`` exists, otherwise joins the
+    chunks into one buffer for a single ``os.write``. The data goes to a uniquely
+    named temporary file beside ``path`` that replaces it only once it is
+    complete, and is removed if writing fails.
+    """
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                     dir=os.path.dirname(path) or ".")
+    try:
+        try:
+            if hasattr(os, "writev") and len(chunks) <= _IOV_MAX:
+                written = os.writev(fd, chunks)
+                if written < sum(map(len, chunks)):
+                    _write_all(fd, b"".join(chunks)[written:])
+            else:
+                _write_all(fd, b"".join(chunks))
+        finally:
+            os.close(fd)
+        # mkstemp creates the file readable by its owner only.
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_if_changed(path, chunks):
+    if _file_matches(path, chunks):
+        return False
+    _write_chunks(path, chunks)
+    return True
+
+
+@lru_cache(maxsize=8)
+def _render_cached(layout, start_year, families_mtime):
+    families = build_families()
+    count = sum(map(_family_size, families))
+    chunks = [layout.head.encode()]
+    for index, text in enumerate(_format_families(families, layout, start_year)):
+        prefix = layout.first_family_prefix if index == 0 else layout.family_separator
+        chunks.append((prefix + text).encode())
+    chunks.append((layout.tail if count else layout.empty_tail).encode())
+    return count, chunks
+
+
+@lru_cache(maxsize=2)
+def _compact_cached(start_year, families_mtime):
+    # Every layout holds the same document; the compact rendering is the quickest
+    # to parse back into it.
+    _, chunks = _render_cached(_COMPACT_LAYOUT, start_year, families_mtime)
+    return b"".join(chunks)
+
+
+@lru_cache(maxsize=2)
+def _packed_cached(start_year, families_mtime):
+    document = _json_loads(_compact_cached(start_year, families_mtime))
+    return msgpack.packb(document, use_bin_type=True)
+
+
+def _render(layout):
+    """Return ``(count, chunks, compact, packed)`` for the whole roster in ``layout``.
+
+    ``compact`` is the document as compact JSON bytes and ``packed`` the same
+    document encoded with ``msgpack``, or ``None`` when msgpack is not
+    installed. The result only depends on ``START_YEAR`` (through ``Age``)
+    and ``families.tsv``, so it is cached on both plus the table's modification
+    time and rebuilt only when one of them changes.
+
+    Rendering allocates many short-lived strings and nothing cyclic, so the
+    cyclic collector is paused and the thread switch interval raised while it
+    runs; both are restored afterwards.
+    """
+    gc_was_enabled = gc.isenabled()
+    switch_interval = sys.getswitchinterval()
+    gc.disable()
+    sys.setswitchinterval(RENDER_SWITCH_INTERVAL)
+    try:
+        start_year = START_YEAR
+        families_mtime = os.path.getmtime(FAMILIES_PATH)
+        count, chunks = _render_cached(layout, start_year, families_mtime)
+        compact = _compact_cached(start_year, families_mtime)
+        packed = None if msgpack is None else _packed_cached(start_year, families_mtime)
+        return count, chunks, compact, packed
+    finally:
+        sys.setswitchinterval(switch_interval)
+        if gc_was_enabled:
+            gc.enable()
+
+
+def generate_characters(output_path="generated_characters.json", one_family_per_line=False,
+                        pretty=True):
+    """Write every family's characters to ``output_path`` and return the document.
+
+    Entries are formatted straight from the family records, without building an
+    intermediate dict per character, and the file is written in a single gather
+    write. An existing file with identical content is left untouched. By default
+    the layout matches ``json.dump({"Characters": [...]}, f, indent=2)`` like the
+    authored data files; ``one_family_per_line`` instead writes each family's
+    entries on a single line, which is smaller and diffs per household. With
+    ``pretty=False`` the document is written without any whitespace, about 40%
+    smaller than the indented file; it has no lines to split, so combining it
+    with ``one_family_per_line`` raises ``ValueError``. Repeated calls in one
+    process reuse the rendered roster.
+
+    When ``msgpack`` is installed the same document is also written next to the
+    JSON file with a ``.msgpack`` extension, for loaders that do not need to read
+    it as text.
+
+    Returns the ``{"Characters": [...]}`` document that was written, parsed
+    afresh from the cached compact rendering on each call.
+    """
+    if not pretty:
+        if one_family_per_line:
+            raise ValueError("one_family_per_line requires pretty=True")
+        layout = _COMPACT_LAYOUT
+    elif one_family_per_line:
+        layout = _FAMILY_LINES_LAYOUT
+    else:
+        layout = _INDENTED_LAYOUT
+    count, chunks, compact, packed = _render(layout)
+    if _write_if_changed(output_path, chunks):
+        print(f"Created {count} characters")
+    else:
+        print(f"{output_path} is up to date ({count} characters)")
+
+    if packed is not None:
+        _write_if_changed(os.path.splitext(output_path)[0] + ".msgpack", [packed])
+
+    return _json_loads(compact)
+
+
+def check_parallel_formatting(start_year=START_YEAR + 48):
+    """Check that pooled and serial formatting give the same text for every layout.
+
+    The pool always runs under the ``spawn`` start method, whose workers
+    re-import this module instead of inheriting the caller's state. The roster
+    is dated to a non-default ``start_year``, set the way a caller would set
+    ``START_YEAR``, so a worker reading the module default shows up in ``Age``.
+    Raises ``RuntimeError`` on a mismatch.
+    """
+    global START_YEAR
+    families = build_families()
+    spawn = multiprocessing.get_context("spawn")
+    default_start_year = START_YEAR
+    START_YEAR = start_year
+    try:
+        for name, layout in (("indented", _INDENTED_LAYOUT),
+                             ("one family per line", _FAMILY_LINES_LAYOUT),
+                             ("compact", _COMPACT_LAYOUT)):
+            serial = _format_families(families, layout, start_year, parallel=False)
+            pooled = _format_families(families, layout, start_year, parallel=True,
+                                      mp_context=spawn)
+            if pooled != serial:
+                raise RuntimeError(f"Parallel formatting differs from serial in the {name} layout")
+    finally:
+        START_YEAR = default_start_year
+    print(f"Parallel and serial formatting match ({len(families)} families)")
 
 
 if __name__ == "__main__":
-    generate_characters()
+    if "--check" in sys.argv[1:]:
+        check_parallel_formatting()
+    else:
+        generate_characters()